@@ -4,6 +4,14 @@
 #
 
 """Initialises ocean lib package."""
+import os
+
+if os.getenv("OCEAN_SKIP_TYPECHECKS") == "1":
+    # Must run before any ocean_lib module imports `enforce_types`,
+    # so that the decorator becomes a no-op everywhere.
+    import enforce_typing
+
+    enforce_typing.enforce_types = lambda f: f
 
 __author__ = """OceanProtocol"""
 # fmt: off
@@ -8,6 +8,7 @@ import json
 import logging
 import os
 import re
+import time
 from datetime import datetime
 from json import JSONDecodeError
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -26,12 +27,19 @@ from ocean_lib.web3_internal.utils import sign_with_key
 
 logger = logging.getLogger(__name__)
 
+# seconds during which a provider's root uri and service endpoints are reused
+PROVIDER_CACHE_TTL = 300
+
 
 class DataServiceProviderBase:
     """DataServiceProviderBase class."""
 
     _http_client = get_requests_session()
     provider_info = None
+    # provider root uri -> time it was validated
+    _provider_roots_cache: Dict[str, float] = {}
+    # provider uri -> (time of fetch, service endpoints)
+    _service_endpoints_cache: Dict[str, Tuple[float, Dict[str, List[str]]]] = {}
 
     @staticmethod
     @enforce_types
@@ -44,12 +52,22 @@ class DataServiceProviderBase:
     def set_http_client(http_client: Session) -> None:
         """Set the http client to something other than the default `requests`."""
         DataServiceProviderBase._http_client = http_client
+        DataServiceProviderBase.clear_provider_cache()
+
+    @staticmethod
+    @enforce_types
+    def clear_provider_cache() -> None:
+        """Forget cached provider root uris and service endpoints."""
+        DataServiceProviderBase._provider_roots_cache.clear()
+        DataServiceProviderBase._service_endpoints_cache.clear()
 
     @staticmethod
     @enforce_types
     def sign_message(wallet, msg: str) -> Tuple[str, str]:
         nonce = str(datetime.utcnow().timestamp())
-        print(f"signing message with nonce {nonce}: {msg}, account={wallet.address}")
+        logger.debug(
+            f"signing message with nonce {nonce}: {msg}, account={wallet.address}"
+        )
         message_hash = Web3.solidityKeccak(
             ["bytes"],
             [Web3.toBytes(text=f"{msg}{nonce}")],
@@ -82,12 +100,24 @@ class DataServiceProviderBase:
     def get_service_endpoints(provider_uri: str) -> Dict[str, List[str]]:
         """
         Return the service endpoints from the provider URL.
+
+        Endpoints are cached per provider URL for `PROVIDER_CACHE_TTL` seconds.
         """
+        cached = DataServiceProviderBase._service_endpoints_cache.get(provider_uri)
+        if cached and time.time() - cached[0] < PROVIDER_CACHE_TTL:
+            return cached[1]
+
         provider_info = DataServiceProviderBase._http_method(
             "get", url=provider_uri
         ).json()
+        service_endpoints = provider_info["serviceEndpoints"]
+
+        DataServiceProviderBase._service_endpoints_cache[provider_uri] = (
+            time.time(),
+            service_endpoints,
+        )
 
-        return provider_info["serviceEndpoints"]
+        return service_endpoints
 
     @staticmethod
     @enforce_types
@@ -148,8 +178,12 @@ class DataServiceProviderBase:
         if not result:
             raise InvalidURL(f"InvalidURL {service_endpoint}.")
 
+        root_result = "/".join(parts[0:3])
+        validated_at = DataServiceProviderBase._provider_roots_cache.get(root_result)
+        if validated_at and time.time() - validated_at < PROVIDER_CACHE_TTL:
+            return result
+
         try:
-            root_result = "/".join(parts[0:3])
             response = requests.get(root_result).json()
         except (requests.exceptions.RequestException, JSONDecodeError):
             raise InvalidURL(f"InvalidURL {service_endpoint}.")
@@ -159,6 +193,8 @@ class DataServiceProviderBase:
                 f"Invalid Provider URL {service_endpoint}, no providerAddress."
             )
 
+        DataServiceProviderBase._provider_roots_cache[root_result] = time.time()
+
         return result
 
     @staticmethod
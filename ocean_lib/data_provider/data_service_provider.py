@@ -8,8 +8,9 @@ import json
 import logging
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import orjson
 import requests
 from enforce_typing import enforce_types
 from requests.models import PreparedRequest, Response
@@ -115,7 +116,7 @@ class DataServiceProvider(DataServiceProviderBase):
         response = DataServiceProvider._http_method(
             "post",
             initialize_compute_endpoint,
-            data=json.dumps(payload),
+            data=DataServiceProvider._dump_payload(payload),
             headers={"content-type": "application/json"},
         )
 
@@ -240,7 +241,7 @@ class DataServiceProvider(DataServiceProviderBase):
         response = DataServiceProvider._http_method(
             "post",
             compute_endpoint,
-            data=json.dumps(payload),
+            data=DataServiceProvider._dump_payload(payload),
             headers={"content-type": "application/json"},
         )
 
@@ -253,7 +254,7 @@ class DataServiceProvider(DataServiceProviderBase):
         )
 
         try:
-            job_info = json.loads(response.content.decode("utf-8"))
+            job_info = orjson.loads(response.content)
             return job_info[0] if isinstance(job_info, list) else job_info
 
         except KeyError as err:
@@ -336,6 +337,33 @@ class DataServiceProvider(DataServiceProviderBase):
             "get", did, job_id, compute_status_endpoint, consumer
         )
 
+    @staticmethod
+    @enforce_types
+    def compute_job_statuses(
+        did: str,
+        dataset_compute_service: Any,
+        consumer,  # Can not add Service typing due to enforce_type errors.
+    ) -> List[Dict[str, Any]]:
+        """
+        Gets the status of all compute jobs started by `consumer` on `did`,
+        using a single request to the provider.
+
+        :param did: hex str the DDO id
+        :param dataset_compute_service:
+        :param consumer of the consumer's account
+
+        :return: list of status info dicts, one for each job
+        """
+        _, compute_status_endpoint = DataServiceProvider.build_compute_endpoint(
+            dataset_compute_service.service_endpoint
+        )
+        resp_content = DataServiceProvider._get_compute_response_content(
+            "get", did, "", compute_status_endpoint, consumer
+        )
+        if isinstance(resp_content, list):
+            return resp_content
+        return [resp_content]
+
     @staticmethod
     @enforce_types
     def compute_job_result(
@@ -391,28 +419,36 @@ class DataServiceProvider(DataServiceProviderBase):
         dataset_compute_service: Any,
         consumer,
         log_type="output",
+        job_status: Optional[dict] = None,
+        fetch_result: Optional[Callable] = None,
     ) -> List[Dict[str, Any]]:
         """
 
         :param job_id: str id of compute job that was returned from `start_compute_job`
         :param dataset_compute_service:
         :param consumer of the consumer's account
+        :param job_status: dict status of the job as returned by `compute_job_status`,
+            requested from the provider if not given
+        :param fetch_result: callable with the signature of `compute_job_result`,
+            used to get each result of type log_type, defaults to `compute_job_result`
 
         :return: dict of job_id to result urls.
         """
-        status = DataServiceProvider.compute_job_status(
-            ddo.did, job_id, dataset_compute_service, consumer
-        )
+        status = job_status
+        if status is None:
+            status = DataServiceProvider.compute_job_status(
+                ddo.did, job_id, dataset_compute_service, consumer
+            )
+        if fetch_result is None:
+            fetch_result = DataServiceProvider.compute_job_result
+
         function_result = []
         for i in range(len(status["results"])):
-            result = None
             result_type = status["results"][i]["type"]
-            result = DataServiceProvider.compute_job_result(
-                job_id, i, dataset_compute_service, consumer
-            )
 
             # Extract algorithm output
             if result_type == log_type:
+                result = fetch_result(job_id, i, dataset_compute_service, consumer)
                 function_result.append(result)
 
         return function_result
@@ -422,6 +458,20 @@ class DataServiceProvider(DataServiceProviderBase):
     def _send_compute_request(
         http_method: str, did: str, job_id: str, service_endpoint: str, consumer
     ) -> Dict[str, Any]:
+        resp_content = DataServiceProvider._get_compute_response_content(
+            http_method, did, job_id, service_endpoint, consumer
+        )
+        if isinstance(resp_content, list):
+            return resp_content[0]
+        return resp_content
+
+    @staticmethod
+    @enforce_types
+    def _get_compute_response_content(
+        http_method: str, did: str, job_id: str, service_endpoint: str, consumer
+    ) -> Union[dict, list]:
+        """Sends a signed request to the compute endpoint and returns the parsed
+        response. An empty `job_id` addresses all jobs of the consumer on `did`."""
         nonce, signature = DataServiceProvider.sign_message(
             consumer, f"{consumer.address}{job_id}{did}"
         )
@@ -430,10 +480,11 @@ class DataServiceProvider(DataServiceProviderBase):
         payload = {
             "consumerAddress": consumer.address,
             "documentId": did,
-            "jobId": job_id,
             "nonce": nonce,
             "signature": signature,
         }
+        if job_id:
+            payload["jobId"] = job_id
         req.prepare_url(service_endpoint, payload)
 
         logger.info(f"invoke compute endpoint with this url: {req.url}")
@@ -446,10 +497,20 @@ class DataServiceProvider(DataServiceProviderBase):
             response, "compute Endpoint", req.url, payload
         )
 
-        resp_content = json.loads(response.content.decode("utf-8"))
-        if isinstance(resp_content, list):
-            return resp_content[0]
-        return resp_content
+        return orjson.loads(response.content)
+
+    @staticmethod
+    @enforce_types
+    def _dump_payload(payload: Dict[str, Any]) -> bytes:
+        """Serializes a request body, using orjson where it can encode the payload.
+
+        Payloads carry user supplied data (userdata, algocustomdata), which may
+        hold ints beyond 64 bits (e.g. wei amounts) that only json can encode.
+        """
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return json.dumps(payload).encode("utf-8")
 
     @staticmethod
     # @enforce_types omitted due to subscripted generics error
@@ -490,34 +551,16 @@ class DataServiceProvider(DataServiceProviderBase):
         )
 
         payload = {
-            "dataset": {
-                "documentId": dataset.did,
-                "serviceId": dataset.service_id,
-                "transferTxId": dataset.transfer_tx_id,
-            },
+            "dataset": dataset.as_dictionary(),
             "environment": compute_environment,
-            "algorithm": {},
             "signature": signature,
             "nonce": nonce,
             "consumerAddress": consumer.address,
             "additionalInputs": _input_datasets or [],
         }
 
-        if dataset.userdata:
-            payload["dataset"]["userdata"] = dataset.userdata
-
         if algorithm:
-            payload.update(
-                {
-                    "algorithm": {
-                        "documentId": algorithm.did,
-                        "serviceId": algorithm.service_id,
-                        "transferTxId": algorithm.transfer_tx_id,
-                    }
-                }
-            )
-            if algorithm.userdata:
-                payload["algorithm"]["userdata"] = algorithm.userdata
+            payload["algorithm"] = algorithm.as_dictionary()
             if algorithm_custom_data:
                 payload["algorithm"]["algocustomdata"] = algorithm_custom_data
         else:
@@ -2,9 +2,19 @@
 # Copyright 2022 Ocean Protocol Foundation
 # SPDX-License-Identifier: Apache-2.0
 #
+from unittest.mock import Mock
+
+import pytest
+from requests.exceptions import InvalidURL
 from requests.models import Response
 
+from ocean_lib.data_provider import base
 from ocean_lib.data_provider.base import DataServiceProviderBase
+from ocean_lib.http_requests.requests_session import get_requests_session
+from tests.resources.mocks.http_client_mock import (
+    TEST_SERVICE_ENDPOINTS,
+    HttpClientNiceMock,
+)
 
 
 def test_validate_content_disposition():
@@ -31,3 +41,46 @@ def test_get_file_name(caplog):
     response.headers["content-disposition"] = "attachment;filename=somehtml.html"
     file_name = DataServiceProviderBase._get_file_name(response)
     assert file_name == "somehtml.html"
+
+
+def test_service_endpoints_cache():
+    DataServiceProviderBase.set_http_client(HttpClientNiceMock())
+
+    endpoints = DataServiceProviderBase.get_service_endpoints("http://mock")
+    assert endpoints == TEST_SERVICE_ENDPOINTS
+    assert DataServiceProviderBase.get_service_endpoints("http://mock") is endpoints
+
+    # setting a new http client invalidates the cached endpoints
+    DataServiceProviderBase.set_http_client(get_requests_session())
+    assert "http://mock" not in DataServiceProviderBase._service_endpoints_cache
+
+
+def test_root_uri_validation_cache(monkeypatch):
+    root_responses = []
+
+    def get_root(url):
+        assert url == "http://provider.mock"
+        return Mock(json=Mock(return_value=root_responses.pop(0)))
+
+    monkeypatch.setattr(base.requests, "get", get_root)
+    DataServiceProviderBase.clear_provider_cache()
+    service_endpoint = "http://provider.mock/api/services/compute"
+
+    # a failed validation is not cached
+    root_responses.append({})
+    with pytest.raises(InvalidURL):
+        DataServiceProviderBase.get_root_uri(service_endpoint)
+    assert "http://provider.mock" not in DataServiceProviderBase._provider_roots_cache
+
+    # a validated root is not requested again
+    root_responses.append({"providerAddress": "0x1234"})
+    root_uri = DataServiceProviderBase.get_root_uri(service_endpoint)
+    assert root_uri == "http://provider.mock"
+    assert DataServiceProviderBase.get_root_uri(service_endpoint) == root_uri
+    assert not root_responses
+
+    # clearing the cache validates the root again
+    DataServiceProviderBase.clear_provider_cache()
+    root_responses.append({"providerAddress": "0x1234"})
+    assert DataServiceProviderBase.get_root_uri(service_endpoint) == root_uri
+    assert not root_responses
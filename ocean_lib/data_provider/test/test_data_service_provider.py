@@ -194,6 +194,36 @@ def test_delete_job_result(provider_wallet):
     DataSP.delete_compute_job("some_did", "some_job_id", mock_service, provider_wallet)
 
 
+@pytest.mark.unit
+def test_compute_job_statuses(with_nice_client, provider_wallet):
+    """Tests that statuses of all jobs are returned as a list."""
+    mock_service = Service(
+        service_id="some_service_id",
+        service_type="some_service_type",
+        service_endpoint=DEFAULT_PROVIDER_URL,
+        datatoken="some_dt",
+        files="some_files",
+        timeout=0,
+        compute_values=dict(),
+    )
+
+    statuses = DataSP.compute_job_statuses("some_did", mock_service, provider_wallet)
+    assert statuses == [{"good_job": "with_mock"}]
+
+
+@pytest.mark.unit
+def test_dump_payload():
+    """Tests that payloads with user data orjson can not encode are still dumped."""
+    payload = {"dataset": {"documentId": "some_did"}, "environment": "some_env"}
+    assert json.loads(DataSP._dump_payload(payload)) == payload
+
+    payload["dataset"]["userdata"] = {"amount": 10**20, 1: "non str key"}
+    assert json.loads(DataSP._dump_payload(payload))["dataset"]["userdata"] == {
+        "amount": 10**20,
+        "1": "non str key",
+    }
+
+
 @pytest.mark.integration
 def test_encrypt(provider_wallet, file1, file2):
     """Tests successful encrypt job."""
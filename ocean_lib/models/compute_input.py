@@ -12,6 +12,17 @@ from ocean_lib.web3_internal.constants import ZERO_ADDRESS
 
 
 class ComputeInput:
+    __slots__ = (
+        "ddo",
+        "did",
+        "transfer_tx_id",
+        "service",
+        "service_id",
+        "userdata",
+        "consume_market_order_fee_token",
+        "consume_market_order_fee_amount",
+    )
+
     @enforce_types
     def __init__(
         self,
@@ -2,14 +2,19 @@
 # Copyright 2022 Ocean Protocol Foundation
 # SPDX-License-Identifier: Apache-2.0
 #
-from typing import Optional, Union
-
-from enforce_typing import enforce_types
+import os
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
 
 from ocean_lib.ocean.util import from_wei, get_address_of_type
 from ocean_lib.web3_internal.constants import MAX_UINT256, ZERO_ADDRESS
 from ocean_lib.web3_internal.contract_base import ContractBase
 
+_ZERO_ADDRESS_LOWER = ZERO_ADDRESS.lower()
+
+# (ADDRESS_FILE, NETWORK_NAME) -> (ADDRESS_FILE mtime, checksummed Dispenser address)
+_dispenser_addresses: Dict[Tuple[Optional[str], str], Tuple[int, str]] = {}
+
 
 class Dispenser(ContractBase):
     CONTRACT_NAME = "Dispenser"
@@ -29,9 +34,8 @@ class DispenserArguments:
         self.allowed_swapper = ContractBase.to_checksum_address(allowed_swapper)
 
     def to_tuple(self, config_dict):
-        dispenser_address = get_address_of_type(config_dict, "Dispenser")
         return (
-            ContractBase.to_checksum_address(dispenser_address),
+            _get_dispenser_address(config_dict),
             self.max_tokens,
             self.max_balance,
             self.with_mint,
@@ -42,6 +46,14 @@ class DispenserArguments:
 class DispenserStatus:
     """Status of dispenser smart contract, for a given datatoken"""
 
+    active: bool
+    owner_address: str
+    is_minter: bool
+    max_tokens: int
+    max_balance: int
+    balance: int
+    allowed_swapper: str
+
     def __init__(self, status_tup):
         """
         :param:status_tup -- returned from Dispenser.sol::status(dt_addr)
@@ -49,32 +61,55 @@ class DispenserStatus:
         uint256 maxTokens, uint256 maxBalance, uint256 balance,
         address allowedSwapper)
         """
-        t = status_tup
-        self.active: bool = t[0]
-        self.owner_address: str = t[1]
-        self.is_minter: bool = t[2]
-        self.max_tokens: int = t[3]
-        self.max_balance: int = t[4]
-        self.balance: int = t[5]
-        self.allowed_swapper: int = t[6]
+        (
+            self.active,
+            self.owner_address,
+            self.is_minter,
+            self.max_tokens,
+            self.max_balance,
+            self.balance,
+            self.allowed_swapper,
+        ) = status_tup
 
     def __str__(self):
-        s = (
-            f"DispenserStatus: "
+        allowed_swapper = (
+            "anyone can request"
+            if self.allowed_swapper.lower() == _ZERO_ADDRESS_LOWER
+            else self.allowed_swapper
+        )
+        return (
+            f"DispenserStatus:\n"
             f"  active = {self.active}\n"
             f"  owner_address = {self.owner_address}\n"
             f"  balance (of tokens) = {_strWithWei(self.balance)}\n"
             f"  is_minter (can mint more tokens?) = {self.is_minter}\n"
             f"  max_tokens (to dispense) = {_strWithWei(self.max_tokens)}\n"
             f"  max_balance (of requester) = {_strWithWei(self.max_balance)}\n"
+            f"  allowed_swapper = {allowed_swapper}\n"
         )
-        if self.allowed_swapper.lower() == ZERO_ADDRESS.lower():
-            s += "  allowed_swapper = anyone can request\n"
-        else:
-            s += f"  allowed_swapper = {self.allowed_swapper}\n"
-        return s
 
 
-@enforce_types
+def _get_dispenser_address(config_dict: dict) -> str:
+    """Returns the Dispenser address for config_dict, reading the address
+    file again only when it was modified since the previous call."""
+    address_file = config_dict.get("ADDRESS_FILE")
+    try:
+        mtime = os.stat(os.path.expanduser(address_file)).st_mtime_ns
+    except (OSError, TypeError):
+        # let get_address_of_type report the missing address file
+        return get_address_of_type(config_dict, "Dispenser")
+
+    key = (address_file, config_dict["NETWORK_NAME"])
+    cached = _dispenser_addresses.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    address = get_address_of_type(config_dict, "Dispenser")
+    _dispenser_addresses[key] = (mtime, address)
+
+    return address
+
+
+@lru_cache(maxsize=256)
 def _strWithWei(x_wei: int) -> str:
     return f"{from_wei(x_wei)} ({x_wei} wei)"
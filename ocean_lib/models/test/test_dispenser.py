@@ -2,11 +2,16 @@
 # Copyright 2022 Ocean Protocol Foundation
 # SPDX-License-Identifier: Apache-2.0
 #
+import json
+import os
+
 import pytest
 
-from ocean_lib.models.dispenser import Dispenser, DispenserStatus
+from ocean_lib.models import dispenser
+from ocean_lib.models.dispenser import Dispenser, DispenserArguments, DispenserStatus
 from ocean_lib.ocean.util import from_wei, get_address_of_type, to_wei
 from ocean_lib.web3_internal.constants import MAX_UINT256, ZERO_ADDRESS
+from ocean_lib.web3_internal.contract_base import ContractBase
 from tests.resources.helper_functions import deploy_erc721_erc20
 
 
@@ -48,6 +53,36 @@ def test_DispenserStatus():
     assert "allowed_swapper = anyone" in s
 
 
+@pytest.mark.unit
+def test_DispenserArguments_caches_dispenser_address(tmp_path, monkeypatch):
+    """Test that the address file is reread only after it is modified"""
+    address_file = tmp_path / "address.json"
+    config_dict = {"ADDRESS_FILE": str(address_file), "NETWORK_NAME": "development"}
+    address1 = ContractBase.to_checksum_address("0x" + "11" * 20)
+    address2 = ContractBase.to_checksum_address("0x" + "22" * 20)
+
+    lookups = []
+
+    def counting_get_address_of_type(*args, **kwargs):
+        lookups.append(args)
+        return get_address_of_type(*args, **kwargs)
+
+    monkeypatch.setattr(dispenser, "get_address_of_type", counting_get_address_of_type)
+
+    address_file.write_text(json.dumps({"development": {"Dispenser": address1}}))
+    os.utime(address_file, ns=(1_000_000_000, 1_000_000_000))
+    args = DispenserArguments()
+    assert args.to_tuple(config_dict)[0] == address1
+    assert args.to_tuple(config_dict)[0] == address1
+    assert len(lookups) == 1
+
+    # a rewritten address file invalidates the cached address
+    address_file.write_text(json.dumps({"development": {"Dispenser": address2}}))
+    os.utime(address_file, ns=(2_000_000_000, 2_000_000_000))
+    assert args.to_tuple(config_dict)[0] == address2
+    assert len(lookups) == 2
+
+
 @pytest.mark.unit
 def test_main_flow_via_simple_ux_and_good_defaults(
     config,
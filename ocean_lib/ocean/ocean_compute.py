@@ -2,8 +2,12 @@
 # Copyright 2022 Ocean Protocol Foundation
 # SPDX-License-Identifier: Apache-2.0
 #
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Type
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from enforce_typing import enforce_types
 
@@ -19,6 +23,15 @@ from ocean_lib.structures.algorithm_metadata import AlgorithmMetadata
 
 logger = logging.getLogger("ocean")
 
+# job statuses which mean the provider could not handle the job
+_FAILED_STATUSES = frozenset({31, 32, None})
+# job status once the job is done and its results can be fetched
+_FINISHED_STATUS = 70
+# prefetched results held in memory at most, oldest are dropped first
+_MAX_PREFETCHED_RESULTS = 16
+# finished jobs remembered as prefetched, so their results are fetched once
+_MAX_PREFETCHED_JOBS = 1024
+
 
 class OceanCompute:
     @enforce_types
@@ -28,6 +41,13 @@ class OceanCompute:
         """Initialises OceanCompute class."""
         self._config_dict = config_dict
         self._data_provider = data_provider
+        # (consumer address, job id, result index) -> pending result fetch
+        self._prefetched_results: Dict[Tuple[str, str, int], Future] = {}
+        # (consumer address, job id) of jobs whose results were prefetched,
+        # a dict used as an insertion ordered set
+        self._prefetched_jobs: Dict[Tuple[str, str], None] = {}
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=4)
 
     @enforce_types
     def start(
@@ -40,6 +60,7 @@ class OceanCompute:
         algorithm_algocustomdata: Optional[dict] = None,
         additional_datasets: List[ComputeInput] = [],
     ) -> str:
+        # resolve the ddo again, so that consumability is checked on its current state
         metadata_cache_uri = self._config_dict.get("METADATA_CACHE_URI")
         ddo = Aquarius.get_instance(metadata_cache_uri).get_ddo(dataset.did)
         service = ddo.get_service_by_id(dataset.service_id)
@@ -70,7 +91,14 @@ class OceanCompute:
         return job_info["jobId"]
 
     @enforce_types
-    def status(self, ddo: DDO, service: Service, job_id: str, wallet) -> Dict[str, Any]:
+    def status(
+        self,
+        ddo: DDO,
+        service: Service,
+        job_id: str,
+        wallet,
+        prefetch_results: bool = False,
+    ) -> Dict[str, Any]:
         """
         Gets job status.
 
@@ -78,14 +106,53 @@ class OceanCompute:
         :param service: compute service of this job
         :param job_id: str id of the compute job
         :param wallet: Wallet instance
+        :param prefetch_results: if the job is finished, start fetching its results
+            in the background, so that the following `result` calls return at once
         :return: dict the status for an existing compute job, keys are (ok, status, statusText)
         """
         job_info = self._data_provider.compute_job_status(
             ddo.did, job_id, service, wallet
         )
-        job_info.update({"ok": job_info.get("status") not in (31, 32, None)})
 
-        return job_info
+        if prefetch_results and job_info.get("status") == _FINISHED_STATUS:
+            self._prefetch_results(job_info, service, job_id, wallet)
+
+        return _with_ok_flag(job_info)
+
+    # @enforce_types omitted due to subscripted generics error
+    def status_many(
+        self, ddo: DDO, service: Service, job_ids: Optional[List[str]], wallet
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Gets the status of several jobs at once.
+
+        All statuses are fetched with a single request to the provider,
+        instead of one request per job. Requested jobs which the provider
+        does not know of are left out of the returned dict, and a warning
+        is logged for them.
+
+        :param ddo: DDO offering the compute service of these jobs
+        :param service: compute service of these jobs
+        :param job_ids: list of str ids of the compute jobs, or None for all jobs of wallet on ddo
+        :param wallet: Wallet instance
+        :return: dict of job id to status, same format as returned by `status`
+        """
+        jobs_info = self._data_provider.compute_job_statuses(ddo.did, service, wallet)
+
+        statuses = {}
+        for job_info in jobs_info:
+            if job_ids is not None and job_info.get("jobId") not in job_ids:
+                continue
+            statuses[job_info.get("jobId")] = _with_ok_flag(job_info)
+
+        if job_ids is not None:
+            missing_job_ids = [job_id for job_id in job_ids if job_id not in statuses]
+            if missing_job_ids:
+                logger.warning(
+                    f"Provider returned no status for compute jobs {missing_job_ids}"
+                )
+
+        return statuses
 
     @enforce_types
     def result(
@@ -101,6 +168,18 @@ class OceanCompute:
         :param wallet: Wallet instance
         :return: dict the results/logs urls for an existing compute job, keys are (did, urls, logs)
         """
+        with self._prefetch_lock:
+            prefetched = self._prefetched_results.pop(
+                (wallet.address, job_id, index), None
+            )
+        if prefetched is not None:
+            try:
+                return prefetched.result()
+            except Exception as e:
+                logger.warning(
+                    f"Prefetching result {index} of job {job_id} failed: {e}"
+                )
+
         result = self._data_provider.compute_job_result(job_id, index, service, wallet)
 
         return result
@@ -113,6 +192,7 @@ class OceanCompute:
         job_id: str,
         wallet,
         log_type="output",
+        job_status: Optional[dict] = None,
     ) -> Dict[str, Any]:
         """
         Gets job output if exists.
@@ -121,10 +201,19 @@ class OceanCompute:
         :param service: compute service of this job
         :param job_id: str id of the compute job
         :param wallet: Wallet instance
+        :param job_status: dict status of the job as returned by `status`, to save
+            requesting it again
         :return: dict the results/logs urls for an existing compute job, keys are (did, urls, logs)
         """
+        if job_status is None:
+            job_status = self.status(ddo, service, job_id, wallet)
+
+        # fetched through `result`, so that prefetched results are reused
+        def fetch_result(job_id, index, service, consumer):
+            return self.result(ddo, service, job_id, index, consumer)
+
         result = self._data_provider.compute_job_result_logs(
-            ddo, job_id, service, wallet, log_type
+            ddo, job_id, service, wallet, log_type, job_status, fetch_result
         )
 
         return result
@@ -142,8 +231,118 @@ class OceanCompute:
         job_info = self._data_provider.stop_compute_job(
             ddo.did, job_id, service, wallet
         )
-        job_info.update({"ok": job_info.get("status") not in (31, 32, None)})
-        return job_info
+
+        return _with_ok_flag(job_info)
+
+    async def start_async(
+        self,
+        consumer_wallet,
+        dataset: ComputeInput,
+        compute_environment: str,
+        algorithm: Optional[ComputeInput] = None,
+        algorithm_meta: Optional[AlgorithmMetadata] = None,
+        algorithm_algocustomdata: Optional[dict] = None,
+        additional_datasets: List[ComputeInput] = [],
+    ) -> str:
+        """Non-blocking version of `start`."""
+        return await self._run_in_executor(
+            self.start,
+            consumer_wallet,
+            dataset,
+            compute_environment,
+            algorithm,
+            algorithm_meta,
+            algorithm_algocustomdata,
+            additional_datasets,
+        )
+
+    async def status_async(
+        self,
+        ddo: DDO,
+        service: Service,
+        job_id: str,
+        wallet,
+        prefetch_results: bool = False,
+    ) -> Dict[str, Any]:
+        """Non-blocking version of `status`, for use with `asyncio.gather`."""
+        return await self._run_in_executor(
+            self.status, ddo, service, job_id, wallet, prefetch_results
+        )
+
+    async def status_many_async(
+        self, ddo: DDO, service: Service, job_ids: Optional[List[str]], wallet
+    ) -> Dict[str, Dict[str, Any]]:
+        """Non-blocking version of `status_many`."""
+        return await self._run_in_executor(
+            self.status_many, ddo, service, job_ids, wallet
+        )
+
+    async def result_async(
+        self, ddo: DDO, service: Service, job_id: str, index: int, wallet
+    ) -> Dict[str, Any]:
+        """Non-blocking version of `result`."""
+        return await self._run_in_executor(
+            self.result, ddo, service, job_id, index, wallet
+        )
+
+    async def compute_job_result_logs_async(
+        self,
+        ddo: DDO,
+        service: Service,
+        job_id: str,
+        wallet,
+        log_type="output",
+        job_status: Optional[dict] = None,
+    ) -> Dict[str, Any]:
+        """Non-blocking version of `compute_job_result_logs`."""
+        return await self._run_in_executor(
+            self.compute_job_result_logs,
+            ddo,
+            service,
+            job_id,
+            wallet,
+            log_type,
+            job_status,
+        )
+
+    async def stop_async(
+        self, ddo: DDO, service: Service, job_id: str, wallet
+    ) -> Dict[str, Any]:
+        """Non-blocking version of `stop`."""
+        return await self._run_in_executor(self.stop, ddo, service, job_id, wallet)
+
+    def _prefetch_results(
+        self, job_info: Dict[str, Any], service: Service, job_id: str, wallet
+    ) -> None:
+        """Starts fetching all results of a finished job in background threads,
+        once per job. Each prefetched result is kept until it is claimed by
+        `result`, or dropped when more than `_MAX_PREFETCHED_RESULTS` are held."""
+        job_key = (wallet.address, job_id)
+        with self._prefetch_lock:
+            if job_key in self._prefetched_jobs:
+                return
+            self._prefetched_jobs[job_key] = None
+            if len(self._prefetched_jobs) > _MAX_PREFETCHED_JOBS:
+                del self._prefetched_jobs[next(iter(self._prefetched_jobs))]
+
+            fetch = self._data_provider.compute_job_result
+            for index in range(len(job_info.get("results", []))):
+                key = (wallet.address, job_id, index)
+                self._prefetched_results[key] = self._prefetch_executor.submit(
+                    fetch, job_id, index, service, wallet
+                )
+
+            while len(self._prefetched_results) > _MAX_PREFETCHED_RESULTS:
+                oldest = next(iter(self._prefetched_results))
+                self._prefetched_results.pop(oldest).cancel()
+
+    @staticmethod
+    async def _run_in_executor(func, *args):
+        """Runs the blocking provider call `func` in the default executor, so that
+        many calls can be awaited concurrently on one event loop. Concurrency is
+        bounded by the executor and the pool size of the provider http session."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args))
 
     @enforce_types
     def get_c2d_environments(self, service_endpoint: str) -> str:
@@ -153,3 +352,9 @@ class OceanCompute:
     def get_free_c2d_environment(self, service_endpoint: str) -> str:
         environments = self.get_c2d_environments(service_endpoint)
         return next(env for env in environments if float(env["priceMin"]) == float(0))
+
+
+def _with_ok_flag(job_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Adds the `ok` key to a job status returned by the provider."""
+    job_info["ok"] = job_info.get("status") not in _FAILED_STATUSES
+    return job_info
@@ -0,0 +1,211 @@
+#
+# Copyright 2022 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+import asyncio
+import logging
+from unittest.mock import Mock
+
+import pytest
+
+from ocean_lib.assets.ddo import DDO
+from ocean_lib.data_provider.data_service_provider import DataServiceProvider
+from ocean_lib.ocean import ocean_compute
+from ocean_lib.ocean.ocean_compute import OceanCompute
+from ocean_lib.services.service import Service
+
+
+class _DataProviderMock(DataServiceProvider):
+    """Answers compute job requests without reaching a provider."""
+
+    result_requests = 0
+
+    @staticmethod
+    def compute_job_status(did, job_id, dataset_compute_service, consumer):
+        if job_id == "finished_job":
+            return {
+                "jobId": job_id,
+                "status": 70,
+                "results": [{"type": "output"}, {"type": "algorithmLog"}],
+            }
+        return {"jobId": job_id, "status": 10}
+
+    @staticmethod
+    def compute_job_result(job_id, index, dataset_compute_service, consumer):
+        _DataProviderMock.result_requests += 1
+        return f"result {index} of {job_id}".encode("utf-8")
+
+    @staticmethod
+    def compute_job_statuses(did, dataset_compute_service, consumer):
+        return [
+            {"jobId": "job1", "status": 10},
+            {"jobId": "job2", "status": 31},
+            {"jobId": "job3", "status": 70},
+        ]
+
+
+@pytest.fixture
+def compute_service():
+    return Service(
+        service_id="some_service_id",
+        service_type="compute",
+        service_endpoint="http://mock/",
+        datatoken="some_dt",
+        files="some_files",
+        timeout=0,
+        compute_values=dict(),
+    )
+
+
+@pytest.mark.unit
+def test_status_many(compute_service):
+    """Tests that statuses are filtered by job id and flagged as ok."""
+    compute = OceanCompute({}, _DataProviderMock)
+    ddo = DDO(did="did:op:123")
+    wallet = Mock()
+
+    statuses = compute.status_many(ddo, compute_service, ["job1", "job2"], wallet)
+    assert list(statuses.keys()) == ["job1", "job2"]
+    assert statuses["job1"]["ok"]
+    assert not statuses["job2"]["ok"]
+
+    statuses = compute.status_many(ddo, compute_service, None, wallet)
+    assert list(statuses.keys()) == ["job1", "job2", "job3"]
+
+
+@pytest.mark.unit
+def test_status_many_warns_on_missing_jobs(compute_service, caplog):
+    """Tests that requested jobs unknown to the provider are logged and left out."""
+    compute = OceanCompute({}, _DataProviderMock)
+    ddo = DDO(did="did:op:123")
+    wallet = Mock()
+
+    with caplog.at_level(logging.WARNING, logger="ocean"):
+        statuses = compute.status_many(
+            ddo, compute_service, ["job1", "unknown_job"], wallet
+        )
+
+    assert list(statuses.keys()) == ["job1"]
+    assert "unknown_job" in caplog.text
+
+
+@pytest.mark.unit
+def test_status_async(compute_service):
+    """Tests that status calls can be gathered on one event loop."""
+    compute = OceanCompute({}, _DataProviderMock)
+    ddo = DDO(did="did:op:123")
+    wallet = Mock()
+
+    async def get_statuses():
+        return await asyncio.gather(
+            *[
+                compute.status_async(ddo, compute_service, job_id, wallet)
+                for job_id in ["job1", "job2"]
+            ]
+        )
+
+    statuses = asyncio.run(get_statuses())
+    assert [status["jobId"] for status in statuses] == ["job1", "job2"]
+    assert all(status["ok"] for status in statuses)
+
+
+@pytest.mark.unit
+def test_compute_job_result_logs_async(compute_service):
+    """Tests that result logs of several jobs can be gathered on one event loop."""
+    compute = OceanCompute({}, _DataProviderMock)
+    ddo = DDO(did="did:op:123")
+    wallet = Mock()
+
+    async def get_logs():
+        return await asyncio.gather(
+            *[
+                compute.compute_job_result_logs_async(
+                    ddo, compute_service, "finished_job", wallet, log_type
+                )
+                for log_type in ["output", "algorithmLog"]
+            ]
+        )
+
+    logs = asyncio.run(get_logs())
+    assert logs == [[b"result 0 of finished_job"], [b"result 1 of finished_job"]]
+
+
+@pytest.mark.unit
+def test_status_prefetches_results(compute_service):
+    """Tests that results of a finished job are fetched once, during status."""
+    compute = OceanCompute({}, _DataProviderMock)
+    ddo = DDO(did="did:op:123")
+    wallet = Mock()
+    _DataProviderMock.result_requests = 0
+
+    compute.status(ddo, compute_service, "job1", wallet, prefetch_results=True)
+    assert not compute._prefetched_results
+
+    compute.status(ddo, compute_service, "finished_job", wallet, prefetch_results=True)
+    assert len(compute._prefetched_results) == 2
+
+    result = compute.result(ddo, compute_service, "finished_job", 1, wallet)
+    assert result == b"result 1 of finished_job"
+    assert len(compute._prefetched_results) == 1
+
+    result = compute.result(ddo, compute_service, "finished_job", 0, wallet)
+    assert result == b"result 0 of finished_job"
+    assert not compute._prefetched_results
+    assert _DataProviderMock.result_requests == 2
+
+    # results already claimed are not fetched again by later status calls
+    compute.status(ddo, compute_service, "finished_job", wallet, prefetch_results=True)
+    assert not compute._prefetched_results
+    assert _DataProviderMock.result_requests == 2
+
+
+@pytest.mark.unit
+def test_compute_job_result_logs_uses_prefetched_results(compute_service):
+    """Tests that result logs are read from prefetched results."""
+    compute = OceanCompute({}, _DataProviderMock)
+    ddo = DDO(did="did:op:123")
+    wallet = Mock()
+    _DataProviderMock.result_requests = 0
+
+    compute.status(ddo, compute_service, "finished_job", wallet, prefetch_results=True)
+    logs = compute.compute_job_result_logs(
+        ddo, compute_service, "finished_job", wallet, "algorithmLog"
+    )
+    assert logs == [b"result 1 of finished_job"]
+    assert _DataProviderMock.result_requests == 2
+
+
+@pytest.mark.unit
+def test_compute_job_result_logs_with_job_status(compute_service):
+    """Tests that only results of the requested type are fetched for a given status."""
+    compute = OceanCompute({}, _DataProviderMock)
+    ddo = DDO(did="did:op:123")
+    wallet = Mock()
+    _DataProviderMock.result_requests = 0
+
+    job_status = {"status": 70, "results": [{"type": "output"}, {"type": "output"}]}
+    logs = compute.compute_job_result_logs(
+        ddo, compute_service, "job1", wallet, job_status=job_status
+    )
+    assert logs == [b"result 0 of job1", b"result 1 of job1"]
+    assert _DataProviderMock.result_requests == 2
+
+    logs = compute.compute_job_result_logs(
+        ddo, compute_service, "job1", wallet, "algorithmLog", job_status
+    )
+    assert logs == []
+    assert _DataProviderMock.result_requests == 2
+
+
+@pytest.mark.unit
+def test_prefetched_results_are_capped(compute_service, monkeypatch):
+    """Tests that the oldest prefetched results are dropped beyond the cap."""
+    monkeypatch.setattr(ocean_compute, "_MAX_PREFETCHED_RESULTS", 1)
+    compute = OceanCompute({}, _DataProviderMock)
+    ddo = DDO(did="did:op:123")
+    wallet = Mock()
+
+    compute.status(ddo, compute_service, "finished_job", wallet, prefetch_results=True)
+    assert list(compute._prefetched_results.keys()) == [
+        (wallet.address, "finished_job", 1)
+    ]
@@ -11,6 +11,19 @@ from ocean_lib.services.consumer_parameters import ConsumerParameters
 
 
 class AlgorithmMetadata:
+    __slots__ = (
+        "url",
+        "rawcode",
+        "language",
+        "format",
+        "version",
+        "container_entry_point",
+        "container_image",
+        "container_tag",
+        "container_checksum",
+        "consumer_parameters",
+    )
+
     @enforce_types
     def __init__(self, metadata_dict: Dict[str, Any]) -> None:
         """Initialises AlgorithmMetadata object."""
@@ -0,0 +1,41 @@
+#
+# Copyright 2022 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Wrong argument types, rejected by enforce_types unless type checks are skipped
+CONSTRUCT_WITH_BAD_TYPES = (
+    "from ocean_lib.ocean.ocean_compute import OceanCompute; OceanCompute(1, 2)"
+)
+
+
+def _run_in_new_interpreter(code: str, skip_typechecks: bool):
+    # enforce_types is replaced at import time, so each case needs a fresh process
+    env = os.environ.copy()
+    env.pop("OCEAN_SKIP_TYPECHECKS", None)
+    if skip_typechecks:
+        env["OCEAN_SKIP_TYPECHECKS"] = "1"
+
+    return subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+
+
+@pytest.mark.unit
+def test_typechecks_enforced_by_default():
+    """Tests that enforce_types rejects bad argument types by default."""
+    result = _run_in_new_interpreter(CONSTRUCT_WITH_BAD_TYPES, skip_typechecks=False)
+    assert result.returncode != 0
+    assert "TypeError" in result.stderr
+
+
+@pytest.mark.unit
+def test_skip_typechecks():
+    """Tests that OCEAN_SKIP_TYPECHECKS=1 turns enforce_types into a no-op."""
+    result = _run_in_new_interpreter(CONSTRUCT_WITH_BAD_TYPES, skip_typechecks=True)
+    assert result.returncode == 0, result.stderr
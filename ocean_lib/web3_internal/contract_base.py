@@ -5,6 +5,7 @@
 
 """All contracts inherit from `ContractBase` class."""
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from enforce_typing import enforce_types
@@ -61,10 +62,16 @@ class ContractBase(object):
         :param address: Address, hex str
         :return: address, hex str
         """
-        return Web3.toChecksumAddress(address.lower())
+        return _checksum_address(address.lower())
 
     def __getattribute__(self, attr):
         try:
             return object.__getattribute__(self, attr)
         except AttributeError:
             return object.__getattribute__(self.contract, attr)
+
+
+@lru_cache(maxsize=4096)
+def _checksum_address(address: str) -> ChecksumAddress:
+    """Memoized EIP-55 checksum, to avoid rehashing the same addresses."""
+    return Web3.toChecksumAddress(address)
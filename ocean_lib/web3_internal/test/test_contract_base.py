@@ -45,6 +45,10 @@ def test_main(config):
     assert factory.contract is not None
     assert factory.contract.address == nft_factory_address
     assert ContractBase.to_checksum_address(nft_factory_address) == nft_factory_address
+    assert (
+        ContractBase.to_checksum_address(nft_factory_address.lower())
+        == nft_factory_address
+    )
 
     # test methods
     assert factory.contract_name == "ERC721Factory"
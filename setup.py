@@ -32,6 +32,7 @@ install_requirements = [
     "scipy",
     "enforce-typing==1.0.0.post1",
     "json-sempai==0.4.0",
+    "orjson",
     "eciespy",
     "eth-brownie==1.19.3",
     "yarl==1.8.1",
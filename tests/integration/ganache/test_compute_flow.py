@@ -272,6 +272,12 @@ def run_compute_test(
         status and status["ok"]
     ), f"something not right about the compute job, got status: {status}"
 
+    statuses = ocean_instance.compute.status_many(
+        dataset_and_userdata.ddo, service, [job_id], consumer_wallet
+    )
+    assert list(statuses.keys()) == [job_id]
+    assert statuses[job_id]["ok"]
+
     status = ocean_instance.compute.stop(
         dataset_and_userdata.ddo, service, job_id, consumer_wallet
     )